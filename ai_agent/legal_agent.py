@@ -1,14 +1,15 @@
 from langchain.agents import Tool, AgentExecutor, LLMSingleActionAgent
 from langchain.prompts import StringPromptTemplate
-from langchain_community.chat_models import ChatOpenAI
 from langchain.schema import AgentAction, AgentFinish, HumanMessage
 from langchain.chains import LLMChain
 from langchain.agents.output_parsers import ReActSingleInputOutputParser
 from typing import List, Union, Tuple, Dict, Any
 import re
 import os
+import asyncio
 from dotenv import load_dotenv
-from legal_tools import PILTool, RTITool, ComplaintTool, LegalDocumentInput
+from legal_tools import PILTool, RTITool, ComplaintTool, LegalDocumentInput, get_llm, ainvoke_llm
+from prompts import render_prompt
 from langdetect import detect
 
 # Load environment variables
@@ -66,11 +67,7 @@ Remember to always include both "Thought:" and "Action:" in your response."""
 
 class LegalDocumentAgent:
     def __init__(self):
-        self.llm = ChatOpenAI(
-            temperature=0.3,
-            model="gpt-4o-mini",
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.llm = get_llm()
         
         # Initialize tools
         self.tools = [
@@ -142,61 +139,10 @@ class LegalDocumentAgent:
         except:
             return "en"
 
-    def translate_text(self, text: str, target_language: str) -> str:
-        if target_language == "hi":
-            prompt = f"Translate the following legal document to Hindi, keeping all formatting and legal terminology:\n\n{text}\n\nHindi:"
-            return self.llm([HumanMessage(content=prompt)]).content.strip()
-        return text
-
-    def classify_document(self, user_input: str) -> str:
-        classification_prompt = f"""You are a legal expert tasked with classifying a legal case into one of three categories: PIL (Public Interest Litigation), RTI (Right to Information), or Complaint.
-
-Consider the following criteria:
-
-PIL (Public Interest Litigation):
-- Involves constitutional rights or fundamental rights
-- Affects public interest or public welfare
-- Concerns governance, policy, or public administration
-- Has broader implications for society
-- Involves environmental protection, public health, or public safety
-- Challenges government actions or policies
-- Involves interpretation of constitutional provisions
-- Affects a large number of people or public at large
-- Requires judicial intervention for proper governance
-
-RTI (Right to Information):
-- Primarily about requesting specific information from public authorities
-- Seeks access to documents, records, or data
-- Concerns transparency and accountability
-- Based on Right to Information Act, 2005
-- Focuses on obtaining information rather than challenging actions
-- Individual or specific information requests
-- No broader public interest implications
-
-Consumer Complaint:
-- Involves defective products or deficient services
-- Concerns individual consumer grievances
-- Based on Consumer Protection Act
-- Involves refund, replacement, or compensation claims
-- Concerns specific business transactions
-- Individual or specific business disputes
-- No broader public interest implications
+    async def classify_document(self, user_input: str) -> str:
+        classification_prompt = render_prompt("agent", "classify", user_input=user_input)
 
-Case Details:
-{user_input}
-
-Analyze the case and determine the PRIMARY purpose and nature of the case. Consider:
-1. What is the main objective of the case?
-2. Who are the primary stakeholders affected?
-3. What is the broader impact on society?
-4. What type of relief is being sought?
-5. What is the appropriate forum for resolution?
-
-Respond with ONLY one of these three words: PIL, RTI, or Complaint.
-
-Your response should be based on the PRIMARY purpose of the case, not secondary aspects. If the case has elements of multiple categories, choose the one that represents the main objective and impact of the case."""
-
-        response = self.llm([HumanMessage(content=classification_prompt)]).content.strip().upper()
+        response = (await ainvoke_llm([HumanMessage(content=classification_prompt)])).content.strip().upper()
         
         # Ensure response is one of the valid categories
         if response not in ["PIL", "RTI", "COMPLAINT"]:
@@ -211,6 +157,9 @@ Your response should be based on the PRIMARY purpose of the case, not secondary
         return response
 
     def generate_document(self, user_input: str, user_name: str, location: str, contact_number: str) -> str:
+        return asyncio.run(self.agenerate_document(user_input, user_name, location, contact_number))
+
+    async def agenerate_document(self, user_input: str, user_name: str, location: str, contact_number: str) -> str:
         try:
             language = self.detect_language(user_input)
             # Parse the user input to extract issue and insights
@@ -222,15 +171,15 @@ Your response should be based on the PRIMARY purpose of the case, not secondary
             full_input = f"User Issue: {user_issue}\nLegal Insights: {insights}\nUser Name: {user_name}\nLocation: {location}\nContact: {contact_number}"
             
             # First, classify the document
-            document_type = self.classify_document(full_input)
+            document_type = await self.classify_document(full_input)
             
             # Then generate the appropriate document
             if document_type == "PIL":
-                content_path = PILTool()._run(user_issue, insights, user_name, location, contact_number, language)
+                content_path = await PILTool()._arun(user_issue, insights, user_name, location, contact_number, language)
             elif document_type == "RTI":
-                content_path = RTITool()._run(user_issue, insights, user_name, location, contact_number, language)
+                content_path = await RTITool()._arun(user_issue, insights, user_name, location, contact_number, language)
             else:
-                content_path = ComplaintTool()._run(user_issue, insights, user_name, location, contact_number, language)
+                content_path = await ComplaintTool()._arun(user_issue, insights, user_name, location, contact_number, language)
             return content_path
                 
         except Exception as e:
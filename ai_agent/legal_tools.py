@@ -1,33 +1,405 @@
 from langchain.tools import BaseTool
-from langchain_openai import ChatOpenAI
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain.schema import HumanMessage
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
 from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER
 import os
+import json
+import asyncio
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 from datetime import datetime
-from typing import Optional, Type
+from types import MappingProxyType
+from xml.sax.saxutils import escape
+from typing import Any, ClassVar, Dict, Mapping, Optional, Tuple, Type, Union
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
+from llm_cache import get_cache
+import httpx
+import openai
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from prompts import render_prompt
+from pdf_classify import LineClassifier, JUSTIFY, SPACED_JUSTIFY, SUB_HEADER, CENTER
 import re
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfbase import pdfmetrics
 
 # Load environment variables
 load_dotenv()
+_OPENAI_KEY = os.getenv("OPENAI_API_KEY")
+
+# Output directory for generated PDFs, created once rather than per document
+os.makedirs("generated_pdfs", exist_ok=True)
 
 # Register Devanagari font for Hindi
 pdfmetrics.registerFont(TTFont('NotoSansDevanagari', 'fonts/NotoSansDevanagari-Regular.ttf'))
 
 LANGUAGE_CONFIG = {
-    "en": {"font": "Times-Roman"},
-    "hi": {"font": "NotoSansDevanagari"},
+    "en": {
+        "font": "Times-Roman",
+        "headers": {
+            "facts": "FACTS OF THE CASE:",
+            "legal": "LEGAL BASIS:",
+            "prayers": "PRAYERS:",
+            "verification": "VERIFICATION:"
+        },
+        "spaced": ("Subject:", "Respected"),
+        "centered": ("Petitioner", "Respondents")
+    },
+    "hi": {
+        "font": "NotoSansDevanagari",
+        "headers": {
+            "facts": "मामले के तथ्य:",
+            "legal": "कानूनी आधार:",
+            "prayers": "प्रार्थनाएँ:",
+            "verification": "सत्यापन:"
+        },
+        "spaced": ("विषय:", "आदरणीय"),
+        "centered": ("याचिकाकर्ता", "प्रतिवादीगण")
+    },
     # Add more languages as needed
 }
 
+# LANGUAGE_CONFIG-derived values, resolved and frozen once at import
+_LANG_RESOLVED: Dict[str, Mapping[str, Any]] = {
+    lang: MappingProxyType({
+        "font": cfg["font"],
+        "headers": MappingProxyType(dict(cfg["headers"])),
+        "template_suffix": "" if lang == "en" else f".{lang}",
+    })
+    for lang, cfg in LANGUAGE_CONFIG.items()
+}
+
+def _resolve_language(language: str) -> Mapping[str, Any]:
+    # Unknown languages fall back to English
+    return _LANG_RESOLVED.get(language, _LANG_RESOLVED["en"])
+
+_MARKDOWN_RE = re.compile(r'\*+')
+_LEAD_NUM_RE = re.compile(r'^\d+\.\s*')
+_STATE_RE = re.compile(r'State of ([^,]+)')
+_RESPONDENT_RE = re.compile(r"from\s+([^,]+)")
+
+# Style id for every known line prefix across languages, resolved by the line classifier
+_LINE_CLASSIFIER = LineClassifier(
+    {
+        **{header: SUB_HEADER for cfg in LANGUAGE_CONFIG.values() for header in cfg["headers"].values()},
+        **{prefix: SPACED_JUSTIFY for cfg in LANGUAGE_CONFIG.values() for prefix in cfg["spaced"]},
+    },
+    frozenset(line for cfg in LANGUAGE_CONFIG.values() for line in cfg["centered"])
+)
+# Paragraph style and whether a spacer precedes the line, by style id
+_STYLE_BY_ID = {
+    JUSTIFY: ('Justify', False),
+    SPACED_JUSTIFY: ('Justify', True),
+    SUB_HEADER: ('SubHeader', True),
+    CENTER: ('Center', False),
+}
+
+def _clean_llm_lines(response: Union[str, list, None]) -> list[str]:
+    # Strip whitespace and markdown emphasis from every non-empty line in a single pass
+    if isinstance(response, str):
+        lines = response.splitlines()
+    elif isinstance(response, list):
+        lines = (str(item) for item in response if item is not None)
+    else:
+        return []
+    return [_MARKDOWN_RE.sub('', line) for line in map(str.strip, lines) if line]
+
+def _numbered_lines(response: Union[str, list]) -> list[str]:
+    return [f"{i}. {_LEAD_NUM_RE.sub('', line)}" for i, line in enumerate(_clean_llm_lines(response), 1)]
+
+# Bump when the shape of cached section responses changes so older entries are never served
+_SECTIONS_CACHE_VERSION = "json-v1"
+_SECTIONS_ATTEMPTS = 3
+
+def _is_points(value: Any) -> bool:
+    return isinstance(value, str) or (
+        isinstance(value, list) and all(isinstance(item, (str, int, float)) for item in value)
+    )
+
+def _parse_sections(response: Optional[str], list_sections: Tuple[str, ...], text_sections: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    # None unless the response is a JSON object carrying every section the prompt asked for:
+    # points as a list (or newline-separated string) and single values as a string or null
+    if response is None:
+        return None
+    try:
+        sections = json.loads(response)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(sections, dict):
+        return None
+    if not all(_is_points(sections.get(key)) for key in list_sections):
+        return None
+    if not all(key in sections and isinstance(sections[key], (str, type(None))) for key in text_sections):
+        return None
+    return sections
+
+_STYLES_CACHE: Dict[str, StyleSheet1] = {}
+
+def _get_styles(language: str) -> StyleSheet1:
+    # Keyed by font so unknown languages share the English stylesheet
+    font_name = _resolve_language(language)["font"]
+    styles = _STYLES_CACHE.get(font_name)
+    if styles is not None:
+        return styles
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        name='Justify',
+        alignment=TA_JUSTIFY,
+        fontName=font_name,
+        fontSize=12,
+        leading=14,
+        spaceBefore=6,
+        spaceAfter=6
+    ))
+    styles.add(ParagraphStyle(
+        name='Center',
+        alignment=TA_CENTER,
+        fontName=font_name,
+        fontSize=12,
+        leading=14,
+        spaceBefore=6,
+        spaceAfter=6
+    ))
+    styles.add(ParagraphStyle(
+        name='Header',
+        alignment=TA_CENTER,
+        fontName=font_name,
+        fontSize=14,
+        leading=16,
+        spaceBefore=12,
+        spaceAfter=12
+    ))
+    styles.add(ParagraphStyle(
+        name='SubHeader',
+        alignment=TA_JUSTIFY,
+        fontName=font_name,
+        fontSize=12,
+        leading=14,
+        spaceBefore=12,
+        spaceAfter=6
+    ))
+    _STYLES_CACHE[font_name] = styles
+    return styles
+
+_PAGE_WIDTH, _PAGE_HEIGHT = LETTER
+_MARGIN = 72
+# SimpleDocTemplate's frame pads its content by 6pt on every side
+_FRAME_PADDING = 6
+_FRAME_LEFT = _MARGIN + _FRAME_PADDING
+_FRAME_TOP = _PAGE_HEIGHT - _MARGIN - _FRAME_PADDING
+_FRAME_BOTTOM = _MARGIN + _FRAME_PADDING
+_FRAME_WIDTH = _PAGE_WIDTH - 2 * _FRAME_LEFT
+# Documents longer than this are laid out by Platypus instead of the canvas fast path
+_CANVAS_MAX_PAGES = 2
+
+def _wrap_line(text: str, font_name: str, font_size: float, space_shrinkage: float) -> list[tuple[str, float, int]]:
+    # Greedy word wrap returning (text, width, word gaps) for each output line.
+    # Like Paragraph.breakLines, each space may shrink by space_shrinkage to fit one more word.
+    space_width = pdfmetrics.stringWidth(' ', font_name, font_size)
+    wrapped, words, width = [], [], 0.0
+    for word in text.split():
+        word_width = pdfmetrics.stringWidth(word, font_name, font_size)
+        if words and width + space_width + word_width > _FRAME_WIDTH + space_shrinkage * space_width * len(words):
+            wrapped.append((' '.join(words), width, len(words) - 1))
+            words, width = [], 0.0
+        width += space_width + word_width if words else word_width
+        words.append(word)
+    wrapped.append((' '.join(words), width, len(words) - 1))
+    return wrapped
+
+def _draw_pdf_canvas(filepath: str, blocks: list[tuple[str, ParagraphStyle, bool]]) -> bool:
+    # Word spacing cannot justify subset TrueType text, so those fonts stay on Platypus
+    if any(isinstance(pdfmetrics.getFont(style.fontName), TTFont) for _, style, _ in blocks):
+        return False
+    
+    pages, page = [], []
+    y = _FRAME_TOP
+    space_after = 0.0
+    for text, style, spaced in blocks:
+        # Mirror Platypus: adjacent paragraph spacing collapses and is dropped at the top of a page
+        if page:
+            y -= space_after + 12 + style.spaceBefore if spaced else max(space_after, style.spaceBefore)
+        wrapped = _wrap_line(text, style.fontName, style.fontSize, style.spaceShrinkage)
+        # Platypus never leaves a paragraph's first line alone at the foot of a page, so break before it
+        if page and len(wrapped) > 1 and y - 2 * style.leading < _FRAME_BOTTOM:
+            y = _FRAME_BOTTOM
+        for i, (line, width, gaps) in enumerate(wrapped):
+            if y - style.leading < _FRAME_BOTTOM:
+                pages.append(page)
+                if len(pages) >= _CANVAS_MAX_PAGES:
+                    return False
+                page, y = [], _FRAME_TOP
+            y -= style.leading
+            x, word_space = _FRAME_LEFT, 0.0
+            if style.alignment == TA_CENTER:
+                x += (_FRAME_WIDTH - width) / 2
+            elif style.alignment == TA_JUSTIFY and gaps and i < len(wrapped) - 1:
+                word_space = (_FRAME_WIDTH - width) / gaps
+            page.append((x, y, line, style.fontName, style.fontSize, word_space))
+        space_after = style.spaceAfter
+    pages.append(page)
+    
+    pdf = canvas.Canvas(filepath, pagesize=LETTER)
+    for page in pages:
+        text_object = pdf.beginText()
+        current_font = None
+        for x, y, line, font_name, font_size, word_space in page:
+            if (font_name, font_size) != current_font:
+                text_object.setFont(font_name, font_size)
+                current_font = (font_name, font_size)
+            text_object.setWordSpace(word_space)
+            text_object.setTextOrigin(x, y)
+            text_object.textOut(line)
+        pdf.drawText(text_object)
+        pdf.showPage()
+    pdf.save()
+    return True
+
+def _build_pdf(content: str, filename: str, language: str = "en") -> str:
+    filepath = os.path.join("generated_pdfs", filename)
+    
+    styles = _get_styles(language)
+    
+    lines = [line for line in map(str.strip, content.splitlines()) if line]
+    style_ids = _LINE_CLASSIFIER.classify_lines(lines)
+    
+    blocks = []
+    for line, style_id in zip(lines, style_ids):
+        style_name, spaced = _STYLE_BY_ID[style_id]
+        blocks.append((line, styles[style_name], spaced))
+    
+    # Short documents are drawn directly; anything longer goes through Platypus
+    if _draw_pdf_canvas(filepath, blocks):
+        return filepath
+    
+    doc = SimpleDocTemplate(
+        filepath,
+        pagesize=LETTER,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72
+    )
+    
+    story = []
+    for line, style, spaced in blocks:
+        if spaced:
+            story.append(Spacer(1, 12))
+        # Paragraph parses markup, so escape it to show the same literal text as the canvas path
+        story.append(Paragraph(escape(line), style))
+            
+    doc.build(story)
+    return filepath
+
+# Workers are spawned rather than forked: forking mid-request from a process with live
+# threads (asyncio.to_thread workers, the cache lock) can deadlock the child.
+_PDF_POOL = None
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        _PDF_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _PDF_POOL
+
+def _discard_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    # A crashed worker breaks the whole pool; drop it so the next call builds a fresh one
+    global _PDF_POOL
+    if _PDF_POOL is pool:
+        _PDF_POOL = None
+    pool.shutdown(wait=False)
+
+_ASYNC_OPENAI = None
+_LLM = None
+_EMBEDDINGS = None
+
+def _get_async_openai() -> openai.AsyncOpenAI:
+    # Chat and embedding calls share one async connection pool with explicit limits
+    global _ASYNC_OPENAI
+    if _ASYNC_OPENAI is None:
+        _ASYNC_OPENAI = openai.AsyncOpenAI(
+            api_key=_OPENAI_KEY,
+            max_retries=2,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        )
+    return _ASYNC_OPENAI
+
+def get_llm() -> ChatOpenAI:
+    # One client per process so every tool reuses the same pooled HTTP connections
+    global _LLM
+    if _LLM is None:
+        _LLM = ChatOpenAI(
+            temperature=0.3,
+            model_name="gpt-4o-mini",
+            openai_api_key=_OPENAI_KEY,
+            async_client=_get_async_openai().chat.completions
+        )
+    return _LLM
+
+def get_embeddings() -> OpenAIEmbeddings:
+    global _EMBEDDINGS
+    if _EMBEDDINGS is None:
+        _EMBEDDINGS = OpenAIEmbeddings(
+            model="text-embedding-3-small",
+            openai_api_key=_OPENAI_KEY,
+            async_client=_get_async_openai().embeddings
+        )
+    return _EMBEDDINGS
+
+# Caps in-flight OpenAI requests across all concurrent documents. A semaphore binds to one
+# event loop and the sync wrappers start a fresh loop per call, so there is one per loop.
+_OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "20"))
+_OPENAI_SEMS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+def _openai_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _OPENAI_SEMS.get(loop)
+    if semaphore is None:
+        semaphore = _OPENAI_SEMS[loop] = asyncio.Semaphore(_OPENAI_MAX_CONCURRENCY)
+    return semaphore
+# Rate-limited calls back off with jitter; the wait happens outside the semaphore
+_openai_retry = retry(
+    wait=wait_exponential_jitter(1, 30),
+    stop=stop_after_attempt(6),
+    retry=retry_if_exception_type(openai.RateLimitError),
+    reraise=True
+)
+
+@_openai_retry
+async def ainvoke_llm(messages: list, **kwargs) -> Any:
+    async with _openai_semaphore():
+        return await get_llm().ainvoke(messages, **kwargs)
+
+@_openai_retry
+async def _aembed(text: str) -> list[float]:
+    async with _openai_semaphore():
+        return await get_embeddings().aembed_query(text)
+
+async def atranslate_text(text: str, target_language: str) -> str:
+    if target_language != "hi":
+        return text
+    cache = get_cache()
+    cached = await asyncio.to_thread(cache.get_translation, text, target_language)
+    if cached is not None:
+        return cached
+    prompt = render_prompt("agent", "translate", target_language, text=text)
+    response = await ainvoke_llm([HumanMessage(content=prompt)])
+    translation = response.content.strip()
+    await asyncio.to_thread(cache.put_translation, text, target_language, translation)
+    return translation
+
 class LegalDocumentInput(BaseModel):
     user_issue: str = Field(description="The main issue or concern to be addressed in the legal document")
     insights: str = Field(description="Additional legal insights or context for the document")
@@ -39,184 +411,126 @@ class BaseLegalTool(BaseTool):
     name: str
     description: str
     template_file: str
-    llm: ChatOpenAI = None
-    env: Environment = None
+    # Keys the tool's content prompt asks the model to return, as lists of points or single strings
+    list_sections: ClassVar[Tuple[str, ...]] = ()
+    text_sections: ClassVar[Tuple[str, ...]] = ()
+    # Shared by every tool instance so parsed templates are reused across requests
+    _env: ClassVar[Environment] = Environment(
+        loader=FileSystemLoader("templates"),
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=FileSystemBytecodeCache()
+    )
+    _template_cache: ClassVar[Dict[Tuple[str, str], Template]] = {}
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.llm = ChatOpenAI(
-            temperature=0.3,
-            model_name="gpt-4o-mini",
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
-        self.env = Environment(loader=FileSystemLoader("templates"))
+    class Config:
+        arbitrary_types_allowed = True
+        copy_on_model_validation = 'none'
+    
+    def _get_template(self, language: str = "en") -> Template:
+        # Configured languages have a localized template next to the English one, e.g. pil_template.hi.txt
+        key = (self.template_file, language)
+        template = self._template_cache.get(key)
+        if template is None:
+            stem, extension = os.path.splitext(self.template_file)
+            template = self._env.get_template(f"{stem}{_resolve_language(language)['template_suffix']}{extension}")
+            self._template_cache[key] = template
+        return template
+
+    async def _translate_fields(self, fields: Dict[str, Any], language: str) -> Dict[str, Any]:
+        # Each value is translated on its own; boilerplate and headers come from the localized template
+        if not _resolve_language(language)["template_suffix"]:
+            return fields
         
-    def _create_pdf(self, content: str, filename: str, language: str = "en") -> str:
-        os.makedirs("generated_pdfs", exist_ok=True)
-        filepath = os.path.join("generated_pdfs", filename)
+        async def translate(value: Any) -> str:
+            text = value if isinstance(value, str) else '\n'.join(value)
+            return await atranslate_text(text, language) if text else text
         
-        doc = SimpleDocTemplate(
-            filepath,
-            pagesize=LETTER,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=72
+        translations = await asyncio.gather(*(translate(value) for value in fields.values()))
+        translated = {}
+        for (key, value), translation in zip(fields.items(), translations):
+            if isinstance(value, str):
+                translated[key] = translation
+            else:
+                translated[key] = [line.strip() for line in translation.splitlines() if line.strip()]
+        return translated
+
+    async def _acall(self, prompt: str) -> str:
+        response = await ainvoke_llm(
+            [HumanMessage(content=prompt)],
+            response_format={"type": "json_object"}
         )
+        return response.content
+
+    async def _complete_sections(self, prompt: str) -> Tuple[str, Dict[str, Any]]:
+        # Malformed or incomplete responses are retried, and never cached or rendered as empty sections
+        for _ in range(_SECTIONS_ATTEMPTS):
+            response = await self._acall(prompt)
+            sections = _parse_sections(response, self.list_sections, self.text_sections)
+            if sections is not None:
+                return response, sections
+        raise ValueError(f"{self.name} response was not a JSON object with keys: {', '.join(self.list_sections + self.text_sections)}")
+
+    async def _cached_sections(self, template_id: str, prompt: str, user_issue: str, insights: str) -> Dict[str, Any]:
+        # Exact match first, then a semantic match against recent requests for the same template.
+        # Only the user's own text is embedded; the shared instructions would swamp the similarity.
+        # SQLite access and the similarity scan run in a thread to keep the event loop free.
+        cache = get_cache()
+        response = await asyncio.to_thread(cache.get, template_id, prompt)
+        sections = _parse_sections(response, self.list_sections, self.text_sections)
+        if sections is not None:
+            return sections
+        try:
+            embedding = await _aembed(f"{user_issue}\n{insights}")
+        except Exception as e:
+            # The cache is only an optimisation; without an embedding the completion is neither looked up nor stored
+            print(f"Embedding failed, skipping semantic cache: {str(e)}")
+            _, sections = await self._complete_sections(prompt)
+            return sections
+        response = await asyncio.to_thread(cache.nearest, template_id, embedding)
+        sections = _parse_sections(response, self.list_sections, self.text_sections)
+        if sections is None:
+            response, sections = await self._complete_sections(prompt)
+        await asyncio.to_thread(cache.put, template_id, prompt, response, embedding)
+        return sections
+
+    async def _generate_sections(self, user_issue: str, insights: str) -> Dict[str, Any]:
+        # Every section of a document comes back from one JSON-mode completion
+        template_id = f"{self.name}/content/{_SECTIONS_CACHE_VERSION}"
+        prompt = render_prompt(self.name, "content", user_issue=user_issue, insights=insights)
+        return await self._cached_sections(template_id, prompt, user_issue, insights)
+
+    def _run(self, user_issue: str, insights: str, user_name: str, location: str, contact_number: str = None, language: str = "en") -> str:
+        return asyncio.run(self._arun(user_issue, insights, user_name, location, contact_number, language))
         
-        font_name = LANGUAGE_CONFIG.get(language, LANGUAGE_CONFIG["en"])['font']
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(
-            name='Justify',
-            alignment=TA_JUSTIFY,
-            fontName=font_name,
-            fontSize=12,
-            leading=14,
-            spaceBefore=6,
-            spaceAfter=6
-        ))
-        styles.add(ParagraphStyle(
-            name='Center',
-            alignment=TA_CENTER,
-            fontName=font_name,
-            fontSize=12,
-            leading=14,
-            spaceBefore=6,
-            spaceAfter=6
-        ))
-        styles.add(ParagraphStyle(
-            name='Header',
-            alignment=TA_CENTER,
-            fontName=font_name,
-            fontSize=14,
-            leading=16,
-            spaceBefore=12,
-            spaceAfter=12
-        ))
-        styles.add(ParagraphStyle(
-            name='SubHeader',
-            alignment=TA_JUSTIFY,
-            fontName=font_name,
-            fontSize=12,
-            leading=14,
-            spaceBefore=12,
-            spaceAfter=6
-        ))
-        
-        story = []
-        lines = content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith(('FACTS OF THE CASE:', 'LEGAL BASIS:', 'PRAYERS:', 'VERIFICATION:')):
-                story.append(Spacer(1, 12))
-                story.append(Paragraph(line, styles['SubHeader']))
-            elif line.startswith('To,'):
-                story.append(Paragraph(line, styles['Justify']))
-            elif line.startswith('Subject:'):
-                story.append(Spacer(1, 12))
-                story.append(Paragraph(line, styles['Justify']))
-            elif line.startswith('Respected'):
-                story.append(Spacer(1, 12))
-                story.append(Paragraph(line, styles['Justify']))
-            elif line.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.')):
-                story.append(Paragraph(line, styles['Justify']))
-            elif line in ['Petitioner', 'Respondents']:
-                story.append(Paragraph(line, styles['Center']))
-            elif line.startswith(('PLACE:', 'DATE:')):
-                story.append(Paragraph(line, styles['Justify']))
-            else:
-                story.append(Paragraph(line, styles['Justify']))
-                
-        doc.build(story)
-        return filepath
+    async def _create_pdf(self, content: str, filename: str, language: str = "en") -> str:
+        # Layout and compression are CPU-bound, so they run in a worker process off the event loop
+        loop = asyncio.get_running_loop()
+        pool = _get_pdf_pool()
+        try:
+            return await loop.run_in_executor(pool, _build_pdf, content, filename, language)
+        except BrokenProcessPool:
+            _discard_pdf_pool(pool)
+            return await loop.run_in_executor(_get_pdf_pool(), _build_pdf, content, filename, language)
 
 class PILTool(BaseLegalTool):
     name = "PIL"
     description = "Generate a Public Interest Litigation (PIL) document"
     template_file = "pil_template.txt"
+    list_sections = ("facts", "legal_basis", "prayers")
     
-    def _generate_legal_content(self, user_issue: str, insights: str) -> tuple[str, str, list]:
-        # First generate the facts of the case
-        facts_prompt = (
-            f"You are a senior advocate drafting a PIL petition. Given the following issue, write a concise and relevant FACTS OF THE CASE section.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate 2-3 key points that are most relevant to the case. Each point should be:\n"
-            f"- Clear and concise\n"
-            f"- Include specific dates and facts\n"
-            f"- Focus on the most critical aspects\n"
-            f"- Be properly formatted as numbered points\n"
-            f"- DO NOT use any markdown formatting or special characters\n"
-            f"Format the response as:\n"
-            f"1. [First key point]\n"
-            f"2. [Second key point]\n"
-            f"3. [Third key point]"
-        )
-        facts_messages = [HumanMessage(content=facts_prompt)]
-        facts_response = self.llm(facts_messages).content
-        
-        # Clean up the facts response
-        facts_lines = [line.strip() for line in facts_response.split('\n') if line.strip()]
-        facts_lines = [re.sub(r'\*\*|\*', '', line) for line in facts_lines]
-        issue_summary = '\n'.join(facts_lines)
-        
-        # Now generate the legal basis
-        legal_prompt = (
-            f"You are a senior advocate drafting a PIL petition. Given the following issue, write a concise and relevant LEGAL BASIS section.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate 3-4 key legal points that are most relevant to the case. Each point should:\n"
-            f"- Cite specific constitutional provisions, laws, or precedents\n"
-            f"- Explain how they apply to the case\n"
-            f"- Be properly formatted as numbered points\n"
-            f"- DO NOT use any markdown formatting or special characters\n"
-            f"Format the response as:\n"
-            f"1. [First legal point with citation]\n"
-            f"2. [Second legal point with citation]\n"
-            f"3. [Third legal point with citation]\n"
-            f"4. [Fourth legal point with citation]"
-        )
-        legal_messages = [HumanMessage(content=legal_prompt)]
-        legal_response = self.llm(legal_messages).content
+    async def _generate_legal_content(self, user_issue: str, insights: str) -> tuple[str, str, list]:
+        # Generate the facts, legal basis and prayers in a single JSON completion
+        sections = await self._generate_sections(user_issue, insights)
         
-        # Clean up the legal response
-        legal_lines = [line.strip() for line in legal_response.split('\n') if line.strip()]
-        legal_lines = [re.sub(r'\*\*|\*', '', line) for line in legal_lines]
-        legal_insights = '\n'.join(legal_lines)
-        
-        # Finally generate the prayers
-        prayers_prompt = (
-            f"You are a senior advocate drafting a PIL petition. Given the following issue, write 1-2 specific and relevant PRAYERS.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate 1-2 specific prayers that:\n"
-            f"- Are directly related to the issue\n"
-            f"- Request concrete actions from the authorities\n"
-            f"- Include specific timeframes where appropriate\n"
-            f"- Be properly formatted as numbered points\n"
-            f"- Be concise and to the point\n"
-            f"- DO NOT use any markdown formatting or special characters\n"
-            f"Format the response as:\n"
-            f"1. [First prayer]\n"
-            f"2. [Second prayer]"
-        )
-        prayers_messages = [HumanMessage(content=prayers_prompt)]
-        prayers_response = self.llm(prayers_messages).content
-        
-        # Clean up and format the prayers
-        prayers = [prayer.strip() for prayer in prayers_response.split('\n') if prayer.strip()]
-        prayers = [re.sub(r'\*\*|\*', '', prayer) for prayer in prayers]
-        prayers = [re.sub(r'^\d+\.\s*', '', prayer) for prayer in prayers]
-        formatted_prayers = [f"{i+1}. {prayer}" for i, prayer in enumerate(prayers)]
+        issue_summary = '\n'.join(_numbered_lines(sections.get("facts", [])))
+        legal_insights = '\n'.join(_numbered_lines(sections.get("legal_basis", [])))
+        formatted_prayers = _numbered_lines(sections.get("prayers", []))
         
         return issue_summary, legal_insights, formatted_prayers
     
-    def _run(self, user_issue: str, insights: str, user_name: str, location: str, contact_number: str = None, language: str = "en") -> str:
-        issue_summary, legal_insights, prayers = self._generate_legal_content(user_issue, insights)
+    async def _arun(self, user_issue: str, insights: str, user_name: str, location: str, contact_number: str = None, language: str = "en") -> str:
+        issue_summary, legal_insights, prayers = await self._generate_legal_content(user_issue, insights)
         current_date = datetime.now()
         location_parts = location.split(',')
         city = location_parts[0].strip()
@@ -229,316 +543,133 @@ class PILTool(BaseLegalTool):
             f"Municipal Corporation of {city}",
             f"{city} Development Authority"
         ]
-        template = self.env.get_template(self.template_file)
+        fields = await self._translate_fields({
+            "user_name": user_name,
+            "user_address": city,
+            "location": state,
+            "issue_summary": issue_summary,
+            "legal_insights": legal_insights,
+            "date": current_date.strftime("%d %B, %Y"),
+            "month": current_date.strftime("%B"),
+            "respondents": respondents,
+            "petition_purpose": "environmental protection and public health",
+            "issue_description": "environmental pollution and public health hazards",
+            "prayers": prayers
+        }, language)
+        template = self._get_template(language)
         content = template.render(
-            user_name=user_name,
-            user_address=city,
-            location=state,
-            issue_summary=issue_summary,
-            legal_insights=legal_insights,
-            date=current_date.strftime("%d %B, %Y"),
             year=current_date.year,
-            month=current_date.strftime("%B"),
-            respondents=respondents,
-            petition_purpose="environmental protection and public health",
-            issue_description="environmental pollution and public health hazards",
-            prayers=prayers,
-            contact_details=f"Contact: {contact_number or '[Contact Number]'}\nAddress: {city}"
+            headers=_resolve_language(language)["headers"],
+            contact_details=f"Contact: {contact_number or '[Contact Number]'}\nAddress: {city}",
+            **fields
         )
-        if language != "en":
-            from legal_agent import LegalDocumentAgent
-            content = LegalDocumentAgent().translate_text(content, language)
         filename = f"PIL_{user_name.replace(' ', '_')}_{language}.pdf"
-        return self._create_pdf(content, filename, language)
+        return await self._create_pdf(content, filename, language)
 
 class RTITool(BaseLegalTool):
     name = "RTI"
     description = "Generate a Right to Information (RTI) application"
     template_file = "rti_template.txt"
+    list_sections = ("information_sought", "legal_basis", "additional_info")
+    text_sections = ("department",)
     
-    def _generate_legal_content(self, user_issue: str, insights: str) -> tuple[str, str, str, list]:
-        # First generate the information sought
-        info_prompt = (
-            f"You are a legal expert drafting an RTI application. Given the following issue, write a clear and specific INFORMATION SOUGHT section.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate 4-5 specific information points that:\n"
-            f"- Are clear and precise\n"
-            f"- Request specific data or documents\n"
-            f"- Be properly formatted as numbered points\n"
-            f"- NOT use any markdown formatting or special characters\n"
-            f"Format the response as:\n"
-            f"1. [First information point]\n"
-            f"2. [Second information point]\n"
-            f"3. [Third information point]\n"
-            f"4. [Fourth information point]\n"
-            f"5. [Fifth information point]"
-        )
-        info_messages = [HumanMessage(content=info_prompt)]
-        info_response = self.llm(info_messages).content
+    async def _generate_legal_content(self, user_issue: str, insights: str) -> tuple[str, str, str, list]:
+        # Generate the information sought, legal basis and department details in a single JSON completion
+        sections = await self._generate_sections(user_issue, insights)
         
-        # Clean up the information sought response
-        info_lines = [line.strip() for line in info_response.split('\n') if line.strip()]
-        info_lines = [re.sub(r'\*\*|\*', '', line) for line in info_lines]
-        information_sought = '\n'.join(info_lines)
-        
-        # Generate the legal basis
-        legal_prompt = (
-            f"You are a legal expert drafting an RTI application. Given the following issue, write a concise and relevant LEGAL BASIS section.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate 3-4 key legal points that:\n"
-            f"- Cite specific sections of RTI Act\n"
-            f"- Explain how they apply to the case\n"
-            f"- Be properly formatted as numbered points\n"
-            f"- NOT use any markdown formatting or special characters\n"
-            f"Format the response as:\n"
-            f"1. [First legal point with citation]\n"
-            f"2. [Second legal point with citation]\n"
-            f"3. [Third legal point with citation]\n"
-            f"4. [Fourth legal point with citation]"
-        )
-        legal_messages = [HumanMessage(content=legal_prompt)]
-        legal_response = self.llm(legal_messages).content
-        
-        # Clean up the legal response
-        legal_lines = [line.strip() for line in legal_response.split('\n') if line.strip()]
-        legal_lines = [re.sub(r'\*\*|\*', '', line) for line in legal_lines]
-        legal_basis = '\n'.join(legal_lines)
-        
-        # Generate the department details
-        department_prompt = (
-            f"You are a legal expert drafting an RTI application. Given the following issue, determine the appropriate department details.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate:\n"
-            f"1. The specific department name\n"
-            f"2. Any additional information or requirements\n"
-            f"Format the response as:\n"
-            f"Department: [department name]\n"
-            f"Additional Info: [any additional information]"
-        )
-        department_messages = [HumanMessage(content=department_prompt)]
-        department_response = self.llm(department_messages).content
-        
-        # Parse department details
-        department_lines = [line.strip() for line in department_response.split('\n') if line.strip()]
-        department_dict = {}
-        for line in department_lines:
-            if line.startswith('Department:'):
-                department_dict['name'] = line.replace('Department:', '').strip()
-            elif line.startswith('Additional Info:'):
-                department_dict['additional_info'] = line.replace('Additional Info:', '').strip()
+        information_sought = '\n'.join(_numbered_lines(sections.get("information_sought", [])))
+        legal_basis = '\n'.join(_numbered_lines(sections.get("legal_basis", [])))
+        department_name = str(sections.get("department") or "").strip() or 'Revenue Department'
         
         # Determine the appropriate pollution control board
         if 'pollution' in user_issue.lower() or 'environment' in user_issue.lower():
             # Extract state from insights if available
-            state_match = re.search(r'State of ([^,]+)', insights)
+            state_match = _STATE_RE.search(insights)
             if state_match:
                 state = state_match.group(1)
-                department_dict['name'] = f"{state} State Pollution Control Board"
+                department_name = f"{state} State Pollution Control Board"
             else:
-                department_dict['name'] = "Central Pollution Control Board"
+                department_name = "Central Pollution Control Board"
         
         # Generate additional information list
-        additional_info = [line.strip() for line in department_dict.get('additional_info', '').split('\n') if line.strip()]
-        formatted_additional_info = [f"{i+1}. {info}" for i, info in enumerate(additional_info)]
+        formatted_additional_info = _numbered_lines(sections.get("additional_info", []))
         
-        return information_sought, legal_basis, department_dict.get('name', 'Revenue Department'), formatted_additional_info
+        return information_sought, legal_basis, department_name, formatted_additional_info
     
-    def _run(self, user_issue: str, insights: str, user_name: str, location: str, contact_number: str = None, language: str = "en") -> str:
-        information_sought, legal_basis, department_name, additional_info = self._generate_legal_content(user_issue, insights)
+    async def _arun(self, user_issue: str, insights: str, user_name: str, location: str, contact_number: str = None, language: str = "en") -> str:
+        information_sought, legal_basis, department_name, additional_info = await self._generate_legal_content(user_issue, insights)
         current_date = datetime.now().strftime("%d %B, %Y")
         location_parts = location.split(',')
         city = location_parts[0].strip()
         state = location_parts[1].strip() if len(location_parts) > 1 else ""
-        template = self.env.get_template(self.template_file)
-        content = template.render(
-            applicant_name=user_name,
-            applicant_address=city,
-            department_name=department_name,
-            office_address=f"{city}",
-            location=state,
-            information_sought=information_sought,
-            legal_basis=legal_basis,
-            additional_info=additional_info,
-            date=current_date,
-            contact_number=contact_number if contact_number else "[Contact Number Not Provided]"
-        )
-        if language != "en":
-            from legal_agent import LegalDocumentAgent
-            content = LegalDocumentAgent().translate_text(content, language)
+        fields = await self._translate_fields({
+            "applicant_name": user_name,
+            "applicant_address": city,
+            "department_name": department_name,
+            "office_address": f"{city}",
+            "location": state,
+            "information_sought": information_sought,
+            "legal_basis": legal_basis,
+            "additional_info": additional_info,
+            "date": current_date,
+            "contact_number": contact_number if contact_number else "[Contact Number Not Provided]"
+        }, language)
+        template = self._get_template(language)
+        content = template.render(**fields)
         filename = f"RTI_{user_name.replace(' ', '_')}_{language}.pdf"
-        return self._create_pdf(content, filename, language)
+        return await self._create_pdf(content, filename, language)
 
 class ComplaintTool(BaseLegalTool):
     name = "Complaint"
     description = "Generate a formal complaint document"
     template_file = "complaint_template.txt"
+    list_sections = ("facts", "legal_basis", "prayers", "documents")
+    text_sections = ("authority_designation", "authority_name", "subject")
     
-    def _generate_legal_content(self, user_issue: str, insights: str) -> tuple[str, str, str, str, str, list, list]:
-        # First generate the facts of the case
-        facts_prompt = (
-            f"You are a legal expert drafting a consumer complaint. Given the following issue, write a concise and relevant FACTS OF THE CASE section.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate 3-4 key points that are most relevant to the case. Each point should:\n"
-            f"- Include specific dates and facts\n"
-            f"- Be clear and concise\n"
-            f"- Focus on the most critical aspects\n"
-            f"- Be properly formatted as numbered points\n"
-            f"- NOT use any markdown formatting or special characters\n"
-            f"Format the response as:\n"
-            f"1. [First key point]\n"
-            f"2. [Second key point]\n"
-            f"3. [Third key point]\n"
-            f"4. [Fourth key point]"
-        )
-        facts_messages = [HumanMessage(content=facts_prompt)]
-        facts_response = self.llm(facts_messages).content
-        
-        # Clean up the facts response
-        facts_lines = [line.strip() for line in facts_response.split('\n') if line.strip()]
-        facts_lines = [re.sub(r'\*\*|\*', '', line) for line in facts_lines]
-        issue_summary = '\n'.join(facts_lines)
+    async def _generate_legal_content(self, user_issue: str, insights: str) -> tuple[str, str, str, str, str, list, list]:
+        # Generate every section and the authority details in a single JSON completion
+        sections = await self._generate_sections(user_issue, insights)
         
-        # Generate the legal basis
-        legal_prompt = (
-            f"You are a legal expert drafting a consumer complaint. Given the following issue, write a concise and relevant LEGAL BASIS section.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate 3-4 key legal points that are most relevant to the case. Each point should:\n"
-            f"- Cite specific sections of Consumer Protection Act or relevant laws\n"
-            f"- Explain how they apply to the case\n"
-            f"- Be properly formatted as numbered points\n"
-            f"- NOT use any markdown formatting or special characters\n"
-            f"Format the response as:\n"
-            f"1. [First legal point with citation]\n"
-            f"2. [Second legal point with citation]\n"
-            f"3. [Third legal point with citation]\n"
-            f"4. [Fourth legal point with citation]"
-        )
-        legal_messages = [HumanMessage(content=legal_prompt)]
-        legal_response = self.llm(legal_messages).content
-        
-        # Clean up the legal response
-        legal_lines = [line.strip() for line in legal_response.split('\n') if line.strip()]
-        legal_lines = [re.sub(r'\*\*|\*', '', line) for line in legal_lines]
-        legal_insights = '\n'.join(legal_lines)
-        
-        # Generate the authority details
-        authority_prompt = (
-            f"You are a legal expert drafting a consumer complaint. Given the following issue, determine the appropriate authority details.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate:\n"
-            f"1. The designation of the authority (e.g., 'The Presiding Officer')\n"
-            f"2. The name of the authority (e.g., 'Consumer Disputes Redressal Commission')\n"
-            f"3. A clear, concise subject line for the complaint\n"
-            f"Format the response as:\n"
-            f"Designation: [authority designation]\n"
-            f"Name: [authority name]\n"
-            f"Subject: [complaint subject]"
-        )
-        authority_messages = [HumanMessage(content=authority_prompt)]
-        authority_response = self.llm(authority_messages).content
-        
-        # Parse authority details
-        authority_lines = [line.strip() for line in authority_response.split('\n') if line.strip()]
-        authority_dict = {}
-        for line in authority_lines:
-            if line.startswith('Designation:'):
-                authority_dict['designation'] = line.replace('Designation:', '').strip()
-            elif line.startswith('Name:'):
-                authority_dict['name'] = line.replace('Name:', '').strip()
-            elif line.startswith('Subject:'):
-                authority_dict['subject'] = line.replace('Subject:', '').strip()
-        
-        # Generate the prayers
-        prayers_prompt = (
-            f"You are a legal expert drafting a consumer complaint. Given the following issue, write specific and relevant PRAYERS.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate 2-3 specific prayers that:\n"
-            f"- Are directly related to the issue\n"
-            f"- Request concrete actions from the authority\n"
-            f"- Include specific timeframes where appropriate\n"
-            f"- Be properly formatted as numbered points\n"
-            f"- Be concise and to the point\n"
-            f"- NOT use any markdown formatting or special characters\n"
-            f"Format the response as:\n"
-            f"1. [First prayer]\n"
-            f"2. [Second prayer]\n"
-            f"3. [Third prayer]"
-        )
-        prayers_messages = [HumanMessage(content=prayers_prompt)]
-        prayers_response = self.llm(prayers_messages).content
-        
-        # Clean up and format the prayers
-        prayers = [prayer.strip() for prayer in prayers_response.split('\n') if prayer.strip()]
-        prayers = [re.sub(r'\*\*|\*', '', prayer) for prayer in prayers]
-        prayers = [re.sub(r'^\d+\.\s*', '', prayer) for prayer in prayers]
-        formatted_prayers = [f"{i+1}. {prayer}" for i, prayer in enumerate(prayers)]
-        
-        # Generate the documents list
-        documents_prompt = (
-            f"You are a legal expert drafting a consumer complaint. Given the following issue, list the relevant documents to be enclosed.\n"
-            f"Issue: {user_issue}\n"
-            f"Additional Context: {insights}\n"
-            f"Generate 4-5 specific documents that:\n"
-            f"- Are relevant to the case\n"
-            f"- Support the claims made\n"
-            f"- Be properly formatted as numbered points\n"
-            f"- NOT use any markdown formatting or special characters\n"
-            f"Format the response as:\n"
-            f"1. [First document]\n"
-            f"2. [Second document]\n"
-            f"3. [Third document]\n"
-            f"4. [Fourth document]\n"
-            f"5. [Fifth document]"
-        )
-        documents_messages = [HumanMessage(content=documents_prompt)]
-        documents_response = self.llm(documents_messages).content
-        
-        # Clean up and format the documents
-        documents = [doc.strip() for doc in documents_response.split('\n') if doc.strip()]
-        documents = [re.sub(r'\*\*|\*', '', doc) for doc in documents]
-        documents = [re.sub(r'^\d+\.\s*', '', doc) for doc in documents]
-        formatted_documents = [f"{i+1}. {doc}" for i, doc in enumerate(documents)]
+        issue_summary = '\n'.join(_numbered_lines(sections.get("facts", [])))
+        legal_insights = '\n'.join(_numbered_lines(sections.get("legal_basis", [])))
+        formatted_prayers = _numbered_lines(sections.get("prayers", []))
+        formatted_documents = _numbered_lines(sections.get("documents", []))
         
         return (
             issue_summary,
             legal_insights,
-            authority_dict.get('designation', 'The Presiding Officer'),
-            authority_dict.get('name', 'Consumer Disputes Redressal Commission'),
-            authority_dict.get('subject', 'Complaint regarding defective product and deficient service'),
+            str(sections.get("authority_designation") or "").strip() or 'The Presiding Officer',
+            str(sections.get("authority_name") or "").strip() or 'Consumer Disputes Redressal Commission',
+            str(sections.get("subject") or "").strip() or 'Complaint regarding defective product and deficient service',
             formatted_prayers,
             formatted_documents
         )
     
-    def _run(self, user_issue: str, insights: str, user_name: str, location: str, contact_number: str = None, language: str = "en") -> str:
-        issue_summary, legal_insights, authority_designation, authority_name, complaint_subject, prayers, documents = self._generate_legal_content(user_issue, insights)
+    async def _arun(self, user_issue: str, insights: str, user_name: str, location: str, contact_number: str = None, language: str = "en") -> str:
+        issue_summary, legal_insights, authority_designation, authority_name, complaint_subject, prayers, documents = await self._generate_legal_content(user_issue, insights)
         current_date = datetime.now().strftime("%d %B, %Y")
-        respondent_match = re.search(r"from\s+([^,]+)", user_issue)
+        respondent_match = _RESPONDENT_RE.search(user_issue)
         respondent_name = respondent_match.group(1) if respondent_match else "Concerned Authority"
-        template = self.env.get_template(self.template_file)
+        fields = await self._translate_fields({
+            "user_name": user_name,
+            "authority_designation": authority_designation,
+            "authority_name": authority_name,
+            "authority_address": f"{location}",
+            "location": location,
+            "respondent_name": respondent_name,
+            "complaint_subject": complaint_subject,
+            "issue_summary": issue_summary,
+            "legal_insights": legal_insights,
+            "prayers": prayers,
+            "documents": documents,
+            "date": current_date,
+            "contact_number": contact_number or "[Contact Number]"
+        }, language)
+        template = self._get_template(language)
         content = template.render(
-            user_name=user_name,
-            authority_designation=authority_designation,
-            authority_name=authority_name,
-            authority_address=f"{location}",
-            location=location,
-            respondent_name=respondent_name,
-            complaint_subject=complaint_subject,
-            issue_summary=issue_summary,
-            legal_insights=legal_insights,
-            prayers=prayers,
-            documents=documents,
-            date=current_date,
-            contact_details=f"Contact: {contact_number or '[Contact Number]'}\nAddress: {location}"
+            headers=_resolve_language(language)["headers"],
+            contact_details=f"Contact: {contact_number or '[Contact Number]'}\nAddress: {location}",
+            **fields
         )
-        if language != "en":
-            from legal_agent import LegalDocumentAgent
-            content = LegalDocumentAgent().translate_text(content, language)
         filename = f"Complaint_{user_name.replace(' ', '_')}_{language}.pdf"
-        return self._create_pdf(content, filename, language) 
\ No newline at end of file
+        return await self._create_pdf(content, filename, language) 
\ No newline at end of file
@@ -0,0 +1,110 @@
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import List, Optional
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "case_canopy", "llm_cache.sqlite")
+MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+SIMILARITY_THRESHOLD = 0.95
+# Only the most recent entries are compared for semantic hits
+RECENT_CANDIDATES = 500
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def _pack(embedding: List[float]) -> bytes:
+    # Store unit vectors so cosine similarity is a plain dot product
+    norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+    return array("f", (x / norm for x in embedding)).tobytes()
+
+def _unpack(blob: bytes) -> array:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector
+
+# SQLite-backed cache of LLM completions and translations
+class LLMCache:
+    def __init__(self, path: str = CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            # Tables from before entries were scoped by template are dropped rather than migrated
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(llm_cache)")}
+            if columns and "template_id" not in columns:
+                self._conn.execute("DROP TABLE llm_cache")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "prompt_hash TEXT PRIMARY KEY, template_id TEXT, prompt TEXT, response TEXT, embedding BLOB, ts INTEGER)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_template_ts ON llm_cache (template_id, ts)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translation_cache ("
+                "text_hash TEXT, language TEXT, translation TEXT, ts INTEGER, PRIMARY KEY (text_hash, language))"
+            )
+            # Invalidate entries older than the retention window
+            cutoff = int(time.time()) - MAX_AGE_SECONDS
+            self._conn.execute("DELETE FROM llm_cache WHERE ts < ?", (cutoff,))
+            self._conn.execute("DELETE FROM translation_cache WHERE ts < ?", (cutoff,))
+
+    def get(self, template_id: str, prompt: str) -> Optional[str]:
+        cutoff = int(time.time()) - MAX_AGE_SECONDS
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE prompt_hash = ? AND ts >= ?",
+                (_hash(f"{template_id}\0{prompt}"), cutoff)
+            ).fetchone()
+        return row[0] if row else None
+
+    def nearest(self, template_id: str, embedding: List[float]) -> Optional[str]:
+        # Only entries rendered from the same prompt template are candidates
+        cutoff = int(time.time()) - MAX_AGE_SECONDS
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT embedding, response FROM llm_cache WHERE template_id = ? AND ts >= ? ORDER BY ts DESC LIMIT ?",
+                (template_id, cutoff, RECENT_CANDIDATES)
+            ).fetchall()
+        query = _unpack(_pack(embedding))
+        best_similarity, best_response = 0.0, None
+        for blob, response in rows:
+            similarity = sum(a * b for a, b in zip(query, _unpack(blob)))
+            if similarity > best_similarity:
+                best_similarity, best_response = similarity, response
+        return best_response if best_similarity > SIMILARITY_THRESHOLD else None
+
+    def put(self, template_id: str, prompt: str, response: str, embedding: List[float]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (_hash(f"{template_id}\0{prompt}"), template_id, prompt, response, _pack(embedding), int(time.time()))
+            )
+
+    def get_translation(self, text: str, language: str) -> Optional[str]:
+        cutoff = int(time.time()) - MAX_AGE_SECONDS
+        text_hash = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translation FROM translation_cache WHERE text_hash = ? AND language = ? AND ts >= ?",
+                (text_hash, language, cutoff)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_translation(self, text: str, language: str, translation: str) -> None:
+        text_hash = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translation_cache VALUES (?, ?, ?, ?)",
+                (text_hash, language, translation, int(time.time()))
+            )
+
+_CACHE = None
+
+def get_cache() -> LLMCache:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = LLMCache()
+    return _CACHE
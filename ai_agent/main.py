@@ -29,7 +29,7 @@ class DocumentRequest(BaseModel):
 async def generate_document(request: DocumentRequest):
     try:
         # Generate the document using the agent
-        pdf_path = legal_agent.generate_document(
+        pdf_path = await legal_agent.agenerate_document(
             user_input=request.user_input,
             user_name=request.user_name,
             location=request.location,
@@ -115,7 +115,7 @@ async def generate_from_backend(
             raise HTTPException(status_code=422, detail="Missing langchain_response in backend data")
         
         # Generate document using the extracted data
-        pdf_path = legal_agent.generate_document(
+        pdf_path = await legal_agent.agenerate_document(
             user_input=user_input,
             user_name=user_name,
             location=location,
@@ -0,0 +1,32 @@
+from typing import Dict, FrozenSet, List, Tuple
+
+# Fully annotated so the module can be compiled with mypyc (`mypyc pdf_classify.py`);
+# the plain Python module is used when no compiled extension is present.
+
+# Style ids returned by LineClassifier
+JUSTIFY = 0
+SPACED_JUSTIFY = 1
+SUB_HEADER = 2
+CENTER = 3
+
+class LineClassifier:
+    def __init__(self, prefix_styles: Dict[str, int], centered: FrozenSet[str]) -> None:
+        self.prefix_styles = prefix_styles
+        self.centered = centered
+        self.prefix_lengths = sorted({len(prefix) for prefix in prefix_styles}, reverse=True)
+        # Most lines are body text; one startswith(tuple) call rejects them before the dict probes
+        self.prefixes: Tuple[str, ...] = tuple(prefix_styles)
+
+    def classify_line(self, line: str) -> int:
+        if line in self.centered:
+            return CENTER
+        if not line.startswith(self.prefixes):
+            return JUSTIFY
+        for length in self.prefix_lengths:
+            style_id = self.prefix_styles.get(line[:length])
+            if style_id is not None:
+                return style_id
+        return JUSTIFY
+
+    def classify_lines(self, lines: List[str]) -> List[int]:
+        return [self.classify_line(line) for line in lines]
@@ -0,0 +1,125 @@
+import functools
+from string import Template
+
+# Content prompts put static instructions first and per-request values last, so every
+# rendered prompt shares a byte-stable prefix and identical requests render to identical strings.
+# The classify prompt keeps its original layout with the case details mid-prompt.
+_PROMPTS = {
+    ("PIL", "content", "en"): """You are a senior advocate drafting a PIL petition. Given the issue below, write the FACTS OF THE CASE, LEGAL BASIS and PRAYERS sections.
+For "facts", generate 2-3 key points that are most relevant to the case. Each point should be:
+- Clear and concise
+- Include specific dates and facts
+- Focus on the most critical aspects
+For "legal_basis", generate 3-4 key legal points that are most relevant to the case. Each point should:
+- Cite specific constitutional provisions, laws, or precedents
+- Explain how they apply to the case
+For "prayers", generate 1-2 specific prayers that:
+- Are directly related to the issue
+- Request concrete actions from the authorities
+- Include specific timeframes where appropriate
+- Be concise and to the point
+DO NOT number the points or use any markdown formatting or special characters.
+Respond with a JSON object in the following format:
+{"facts": ["First key point", "..."], "legal_basis": ["First legal point with citation", "..."], "prayers": ["First prayer", "..."]}
+
+Issue: $user_issue
+Additional Context: $insights""",
+    ("RTI", "content", "en"): """You are a legal expert drafting an RTI application. Given the issue below, write the INFORMATION SOUGHT and LEGAL BASIS sections and determine the appropriate department details.
+For "information_sought", generate 4-5 specific information points that:
+- Are clear and precise
+- Request specific data or documents
+For "legal_basis", generate 3-4 key legal points that:
+- Cite specific sections of RTI Act
+- Explain how they apply to the case
+For "department", give the specific department name.
+For "additional_info", list any additional information or requirements.
+DO NOT number the points or use any markdown formatting or special characters.
+Respond with a JSON object in the following format:
+{"information_sought": ["First information point", "..."], "legal_basis": ["First legal point with citation", "..."], "department": "department name", "additional_info": ["any additional information"]}
+
+Issue: $user_issue
+Additional Context: $insights""",
+    ("Complaint", "content", "en"): """You are a legal expert drafting a consumer complaint. Given the issue below, write the FACTS OF THE CASE, LEGAL BASIS, PRAYERS and DOCUMENTS ENCLOSED sections and determine the appropriate authority details.
+For "facts", generate 3-4 key points that are most relevant to the case. Each point should:
+- Include specific dates and facts
+- Be clear and concise
+- Focus on the most critical aspects
+For "legal_basis", generate 3-4 key legal points that are most relevant to the case. Each point should:
+- Cite specific sections of Consumer Protection Act or relevant laws
+- Explain how they apply to the case
+For "authority_designation", give the designation of the authority (e.g., 'The Presiding Officer').
+For "authority_name", give the name of the authority (e.g., 'Consumer Disputes Redressal Commission').
+For "subject", write a clear, concise subject line for the complaint.
+For "prayers", generate 2-3 specific prayers that:
+- Are directly related to the issue
+- Request concrete actions from the authority
+- Include specific timeframes where appropriate
+- Be concise and to the point
+For "documents", list 4-5 specific documents to be enclosed that:
+- Are relevant to the case
+- Support the claims made
+DO NOT number the points or use any markdown formatting or special characters.
+Respond with a JSON object in the following format:
+{"facts": ["First key point", "..."], "legal_basis": ["First legal point with citation", "..."], "authority_designation": "authority designation", "authority_name": "authority name", "subject": "complaint subject", "prayers": ["First prayer", "..."], "documents": ["First document", "..."]}
+
+Issue: $user_issue
+Additional Context: $insights""",
+    ("agent", "classify", "en"): """You are a legal expert tasked with classifying a legal case into one of three categories: PIL (Public Interest Litigation), RTI (Right to Information), or Complaint.
+
+Consider the following criteria:
+
+PIL (Public Interest Litigation):
+- Involves constitutional rights or fundamental rights
+- Affects public interest or public welfare
+- Concerns governance, policy, or public administration
+- Has broader implications for society
+- Involves environmental protection, public health, or public safety
+- Challenges government actions or policies
+- Involves interpretation of constitutional provisions
+- Affects a large number of people or public at large
+- Requires judicial intervention for proper governance
+
+RTI (Right to Information):
+- Primarily about requesting specific information from public authorities
+- Seeks access to documents, records, or data
+- Concerns transparency and accountability
+- Based on Right to Information Act, 2005
+- Focuses on obtaining information rather than challenging actions
+- Individual or specific information requests
+- No broader public interest implications
+
+Consumer Complaint:
+- Involves defective products or deficient services
+- Concerns individual consumer grievances
+- Based on Consumer Protection Act
+- Involves refund, replacement, or compensation claims
+- Concerns specific business transactions
+- Individual or specific business disputes
+- No broader public interest implications
+
+Case Details:
+$user_input
+
+Analyze the case and determine the PRIMARY purpose and nature of the case. Consider:
+1. What is the main objective of the case?
+2. Who are the primary stakeholders affected?
+3. What is the broader impact on society?
+4. What type of relief is being sought?
+5. What is the appropriate forum for resolution?
+
+Respond with ONLY one of these three words: PIL, RTI, or Complaint.
+
+Your response should be based on the PRIMARY purpose of the case, not secondary aspects. If the case has elements of multiple categories, choose the one that represents the main objective and impact of the case.""",
+    ("agent", "translate", "hi"): """Translate the following legal document to Hindi, keeping all formatting and legal terminology:
+
+$text
+
+Hindi:""",
+}
+
+@functools.lru_cache(maxsize=None)
+def _template(tool: str, section: str, lang: str) -> Template:
+    return Template(_PROMPTS[(tool, section, lang)])
+
+def render_prompt(tool: str, section: str, lang: str = "en", **values: str) -> str:
+    return _template(tool, section, lang).safe_substitute(values)
@@ -0,0 +1,84 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+import legal_tools
+import llm_cache
+from legal_tools import RTITool, _numbered_lines, _parse_sections
+
+RTI_SECTIONS = {
+    "information_sought": ["Copies of inspection reports"],
+    "legal_basis": ["Section 6(1) of the RTI Act"],
+    "department": "Revenue Department",
+    "additional_info": ["Applicant is a resident of the ward"],
+}
+
+def _rti(**overrides):
+    return json.dumps({**RTI_SECTIONS, **overrides})
+
+class _Response:
+    def __init__(self, content):
+        self.content = content
+
+class _StubLLM:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        self.calls += 1
+        return _Response(self.responses.pop(0))
+
+class _StubEmbeddings:
+    async def aembed_query(self, text):
+        return [1.0, 0.0, 0.0]
+
+class ParseSectionsTest(unittest.TestCase):
+    def test_rejects_null_and_numeric_sections(self):
+        keys = (RTITool.list_sections, RTITool.text_sections)
+        self.assertIsNone(_parse_sections(_rti(additional_info=None), *keys))
+        self.assertIsNone(_parse_sections(_rti(information_sought=7), *keys))
+        self.assertIsNone(_parse_sections(_rti(department=5), *keys))
+        self.assertIsNone(_parse_sections(_rti(legal_basis=[None]), *keys))
+
+    def test_accepts_null_text_and_numeric_points(self):
+        keys = (RTITool.list_sections, RTITool.text_sections)
+        sections = _parse_sections(_rti(department=None, additional_info=[1, "Ward 12"]), *keys)
+        self.assertIsNotNone(sections)
+        self.assertEqual(_numbered_lines(sections["additional_info"]), ["1. 1", "2. Ward 12"])
+
+    def test_numbered_lines_treats_null_as_empty(self):
+        self.assertEqual(_numbered_lines(None), [])
+        self.assertEqual(_numbered_lines(3), [])
+        self.assertEqual(_numbered_lines([None, "Point"]), ["1. Point"])
+
+class GenerateSectionsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.saved = (legal_tools._LLM, legal_tools._EMBEDDINGS, llm_cache._CACHE)
+        llm_cache._CACHE = llm_cache.LLMCache(os.path.join(self.tmp.name, "cache.sqlite"))
+        legal_tools._EMBEDDINGS = _StubEmbeddings()
+
+    def tearDown(self):
+        legal_tools._LLM, legal_tools._EMBEDDINGS, llm_cache._CACHE = self.saved
+        self.tmp.cleanup()
+
+    def test_null_section_is_retried_and_not_cached(self):
+        llm = legal_tools._LLM = _StubLLM([_rti(additional_info=None), _rti()])
+        content = asyncio.run(RTITool()._generate_legal_content("Road repair records", ""))
+        self.assertEqual(llm.calls, 2)
+        self.assertEqual(content[3], ["1. Applicant is a resident of the ward"])
+        # A second identical request is served from the cache with the valid response
+        content = asyncio.run(RTITool()._generate_legal_content("Road repair records", ""))
+        self.assertEqual(llm.calls, 2)
+        self.assertEqual(content[3], ["1. Applicant is a resident of the ward"])
+
+    def test_invalid_responses_raise(self):
+        legal_tools._LLM = _StubLLM([_rti(additional_info=None)] * 3)
+        with self.assertRaises(ValueError):
+            asyncio.run(RTITool()._generate_legal_content("Road repair records", ""))
+
+if __name__ == "__main__":
+    unittest.main()